@@ -8,20 +8,28 @@
 
 """Import modules and packages by path."""
 
-import collections
 import functools
 import importlib
 import importlib.machinery
 import importlib.util
 import logging
+import os
 import sys
 import typing as t
+import weakref
 from enum import Enum
 from pathlib import Path, PurePath
 from types import ModuleType, TracebackType
 
 LOG = logging.getLogger(__name__)
 
+# Modules previously returned by `import_from_path()`, keyed by its
+# argument and, for relative paths, the working directory. Only used if
+# the module is still in `sys.modules` and its file still exists.
+_IMPORT_CACHE: "weakref.WeakValueDictionary[t.Tuple[str, str], ModuleType]" = (
+    weakref.WeakValueDictionary()
+)
+
 
 class IllegalImport(ImportError):
     """An import modified the environment in a disallowed manner."""
@@ -72,7 +80,9 @@ class BackupModules:
         return self._modules_stack[-1]
 
     def __enter__(self) -> "BackupModules":
-        self._modules_stack.append(dict(sys.modules))
+        # We need a full copy, not just the set of names: it's used to
+        # restore `sys.modules` on failure and to detect modifications.
+        self._modules_stack.append(sys.modules.copy())
         return self
 
     def __exit__(
@@ -129,8 +139,9 @@ class BackupModules:
                 yield ChangeKind.REMOVAL, name
             elif new_module is not old_module:
                 yield ChangeKind.MODIFICATION, name
-        for name in set(new_modules).difference(old_modules):
-            yield ChangeKind.ADDITION, name
+        for name in new_modules:
+            if name not in old_modules:
+                yield ChangeKind.ADDITION, name
 
 
 def import_from_path(to_be_imported: str) -> ModuleType:
@@ -200,20 +211,51 @@ def import_from_path(to_be_imported: str) -> ModuleType:
         <module 'strange::package.module' from './strange::package/module.py'>
     """
     path, child_segments = _split_import_name(to_be_imported, Path)
-    spec = _find_root_spec(path)
-    with BackupModules(keep_on_success=True) as backup:
-        if child_segments:
-            LOG.debug("descendant chain: %s", list(child_segments))
-        module = functools.reduce(
-            _search_and_import_child,
-            child_segments,
-            _import_module_from_spec(spec),
+    # Like `_find_root_spec()`, resolve relative paths per working
+    # directory.
+    cache_key = (to_be_imported, "" if path.is_absolute() else os.getcwd())
+    cached = _IMPORT_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and sys.modules.get(cached.__name__) is cached
+        and not _is_stale(cached.__spec__)
+    ):
+        LOG.info("skipping: %s (already imported)", cached.__name__)
+        return cached
+    try:
+        spec = _find_root_spec(path)
+        with BackupModules(keep_on_success=True) as backup:
+            module = _import_chain(spec, child_segments, to_be_imported)
+            _assert_only_additions(backup)
+    except Exception:
+        # The files on disk may have changed since we cached their
+        # specs. Give the next attempt a clean slate.
+        _find_root_spec_cached.cache_clear()
+        _find_child_spec.cache_clear()
+        raise
+    _IMPORT_CACHE[cache_key] = module
+    return module
+
+
+def _import_chain(
+    spec: importlib.machinery.ModuleSpec,
+    child_segments: t.Tuple[str, ...],
+    to_be_imported: str,
+) -> ModuleType:
+    """Import a root module and then each child in turn.
+
+    Return the last module imported. *to_be_imported* is only used in
+    error messages.
+    """
+    if child_segments:
+        LOG.debug("descendant chain: %s", list(child_segments))
+    module = _import_module_from_spec(spec)
+    for child_name in child_segments:
+        module = _search_and_import_child(module, child_name)
+    if _is_namespace_package(module):
+        raise UselessNamespacePackage(
+            f"no __init__.py found, please check the path: {to_be_imported}"
         )
-        if _is_namespace_package(module):
-            raise UselessNamespacePackage(
-                f"no __init__.py found, please check the path: {to_be_imported}"
-            )
-        _assert_only_additions(backup)
     return module
 
 
@@ -225,37 +267,129 @@ def _split_import_name(
 ) -> t.Tuple[P, t.Tuple[str, ...]]:
     """Extract file path and submodules from an import name."""
     reverse_segments = []
+    # Scan from the right without slicing off the rest each time. A
+    # trailing slash protects a path that contains "::".
+    end = len(path_and_modules)
     while True:
-        rest, double_colons, module_name = path_and_modules.rpartition("::")
-        if not double_colons or "/" in module_name or "\\" in module_name:
+        start = path_and_modules.rfind("::", 0, end)
+        module_name = path_and_modules[start + 2 : end]
+        if start < 0 or "/" in module_name or "\\" in module_name:
             break
         reverse_segments.append(module_name)
-        path_and_modules = rest
-    return path_class(path_and_modules), tuple(reversed(reverse_segments))
+        end = start
+    return path_class(path_and_modules[:end]), tuple(reversed(reverse_segments))
 
 
 def _find_root_spec(path: Path) -> importlib.machinery.ModuleSpec:
     """Find a spec that tells us how to import from a path.
 
+    The result is cached, so repeated imports from the same path don't
+    search the file system again. Relative paths are cached per working
+    directory.
+
     Raises:
         ModuleNotFoundError if nothing can be imported from the path.
             This is e.g. the case if `path` points at a non-Python file
             or a directory without `__init__.py`.
     """
-    name = path.stem
-    search_dir = path.parent
+    cwd = "" if path.is_absolute() else os.getcwd()
+    spec = _find_root_spec_cached(path, cwd)
+    if _is_stale(spec):
+        _find_root_spec_cached.cache_clear()
+        spec = _find_root_spec_cached(path, cwd)
+    return spec
+
+
+_FILE_LOADERS = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+    importlib.machinery.ExtensionFileLoader,
+)
+
+
+def _is_stale(spec: t.Optional[importlib.machinery.ModuleSpec]) -> bool:
+    """Return True if the file behind *spec* has been moved or deleted.
+
+    Only specs loaded from plain files are checked. Others, e.g. from
+    zip archives, are never considered stale.
+    """
+    return (
+        spec is not None
+        and isinstance(spec.loader, _FILE_LOADERS)
+        and not os.path.exists(spec.origin or "")
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _find_root_spec_cached(
+    path: Path,
+    cwd: str,  # noqa: ARG001
+) -> importlib.machinery.ModuleSpec:
+    """Implementation of `_find_root_spec()`.
+
+    The *cwd* argument is only used as part of the cache key.
+    """
+    # Equivalent to `path.parent` and `path.stem`, but without creating
+    # two intermediate `Path` objects.
+    search_dir, base = os.path.split(os.fspath(path))
+    name = os.path.splitext(base)[0]
+    search_dir = search_dir or "."
     LOG.info('searching for root package "%s" in path "%s"', name, search_dir)
-    spec = importlib.machinery.PathFinder.find_spec(name, path=[str(search_dir)])
+    spec = _scan_for_simple_spec(name, search_dir)
+    if not spec:
+        spec = importlib.machinery.PathFinder.find_spec(name, path=[search_dir])
     if not spec:
         raise ModuleNotFoundError(path)
     return spec
 
 
+def _scan_for_simple_spec(
+    name: str, search_dir: str
+) -> t.Optional[importlib.machinery.ModuleSpec]:
+    """Fast path of `_find_root_spec()` for the common cases.
+
+    This lists *search_dir* once and builds the spec directly if it
+    contains either a plain source file ``name.py`` or a regular package
+    ``name/__init__.py``. This avoids probing each candidate file name
+    individually.
+
+    Return None in all other cases (e.g. zip files, extension modules,
+    namespace packages or ambiguous names) so that the caller can fall
+    back to `~importlib.machinery.PathFinder`.
+    """
+    try:
+        with os.scandir(search_dir) as entries:
+            candidates = [
+                entry
+                for entry in entries
+                if entry.name == name or entry.name.startswith(name + ".")
+            ]
+    except OSError:
+        return None
+    if len(candidates) != 1:
+        return None
+    [entry] = candidates
+    # Like `FileFinder`, resolve the current directory to an absolute
+    # path.
+    if search_dir in ("", "."):
+        search_dir = os.getcwd()
+    location = os.path.join(search_dir, entry.name)
+    if entry.name == name + ".py" and entry.is_file():
+        return importlib.util.spec_from_file_location(name, location)
+    init = os.path.join(location, "__init__.py")
+    if entry.name == name and entry.is_dir() and os.path.isfile(init):
+        return importlib.util.spec_from_file_location(
+            name, init, submodule_search_locations=[location]
+        )
+    return None
+
+
 def _import_module_from_spec(spec: importlib.machinery.ModuleSpec) -> ModuleType:
     """Import a module based on its spec."""
-    if spec.name in sys.modules:
+    existing = sys.modules.get(spec.name)
+    if existing is not None:
         LOG.info("skipping: %s (already imported)", spec.name)
-        return sys.modules[spec.name]
+        return existing
     if spec.loader is None:
         # Namespace package. Import it here and check later that the
         # leaf module is a real one. This prevents path confusion like
@@ -284,14 +418,22 @@ def _search_and_import_child(parent: ModuleType, child_name: str) -> ModuleType:
     assert parent_spec is not None
     assert not child_name.startswith(".")
     absolute_name = f"{parent_spec.name}.{child_name}"
-    paths = parent_spec.submodule_search_locations or []
-    LOG.debug("searching descendant %r in %r", absolute_name, paths)
-    spec = importlib.machinery.PathFinder.find_spec(absolute_name, paths)
+    paths = tuple(parent_spec.submodule_search_locations or ())
+    spec = _find_child_spec(absolute_name, paths)
     if spec is None:
         raise ModuleNotFoundError(absolute_name)
     return _import_module_from_spec(spec)
 
 
+@functools.lru_cache(maxsize=512)
+def _find_child_spec(
+    absolute_name: str, paths: t.Tuple[str, ...]
+) -> t.Optional[importlib.machinery.ModuleSpec]:
+    """Cached search for a child module in the given search paths."""
+    LOG.debug("searching descendant %r in %r", absolute_name, paths)
+    return importlib.machinery.PathFinder.find_spec(absolute_name, list(paths))
+
+
 def _is_namespace_package(module: ModuleType) -> bool:
     """Return True if the given module represents a namespace package.
 
@@ -307,8 +449,10 @@ def _is_namespace_package(module: ModuleType) -> bool:
     """
     # For namespace packages, __file__ isn't set or is set to None.
     # We also need to check __path__ because built-in modules don't have
-    # __file__ set either.
-    return hasattr(module, "__path__") and getattr(module, "__file__", None) is None
+    # __file__ set either. Both are plain entries in the module's
+    # namespace, so we can skip the attribute protocol.
+    namespace = vars(module)
+    return "__path__" in namespace and namespace.get("__file__") is None
 
 
 def _assert_only_additions(backup: BackupModules) -> None:
@@ -327,16 +471,22 @@ def _assert_only_additions(backup: BackupModules) -> None:
         ...
         IllegalImport: ...
     """
-    changes: t.Dict[ChangeKind, t.List[str]] = collections.defaultdict(list)
+    additions: t.List[str] = []
+    modifications: t.List[str] = []
+    removals: t.List[str] = []
+    buckets = {
+        ChangeKind.ADDITION: additions,
+        ChangeKind.MODIFICATION: modifications,
+        ChangeKind.REMOVAL: removals,
+    }
     for kind, name in backup.iter_changes():
-        print("module ", name)
-        changes[kind].append(name)
-    # First remove additions, then check if there are any other changes.
-    additions = changes.pop(ChangeKind.ADDITION, [])
-    if changes:
+        buckets[kind].append(name)
+    if modifications or removals:
         raise IllegalImport(
             ", ".join(
-                f"{kind.value} modules: {names}" for kind, names in changes.items()
+                f"{kind.value} modules: {names}"
+                for kind, names in buckets.items()
+                if names and kind is not ChangeKind.ADDITION
             )
         )
     LOG.info("imported modules:")
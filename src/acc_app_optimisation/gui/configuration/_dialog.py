@@ -8,11 +8,11 @@
 
 from __future__ import annotations
 
+import math
 import typing as t
 from logging import getLogger
 
 import gymnasium as gym
-import numpy as np
 from cernml import coi
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import QDialog, QDialogButtonBox, QTabWidget, QVBoxLayout, QWidget
@@ -66,6 +66,12 @@ class _BaseDialog(QDialog):
         )
         self._controls.button(QDialogButtonBox.Cancel).clicked.connect(self.reject)
 
+    def _lay_out(self, content: QWidget) -> None:
+        """Put *content* above the dialog buttons."""
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(content)
+        main_layout.addWidget(self._controls)
+
     def _on_ok_clicked(self) -> None:
         """Apply the configs and close the window."""
         # Only close the dialog if there was no error.
@@ -112,9 +118,7 @@ class PureDialog(_BaseDialog):
     ) -> None:
         super().__init__(target, parent)
         assert self._cfgform is not None
-        main_layout = QVBoxLayout(self)
-        main_layout.addWidget(self._cfgform)
-        main_layout.addWidget(self._controls)
+        self._lay_out(self._cfgform)
 
 
 class OptimizableDialog(_BaseDialog):
@@ -150,9 +154,7 @@ class OptimizableDialog(_BaseDialog):
         else:
             self._points_page = None
             self._skeleton_points = ()
-        main_layout = QVBoxLayout(self)
-        main_layout.addWidget(self._tab_widget)
-        main_layout.addWidget(self._controls)
+        self._lay_out(self._tab_widget)
 
     def skeletonPoints(self) -> t.Tuple[float, ...]:
         return self._skeleton_points
@@ -226,14 +228,16 @@ class EnvDialog(_BaseDialog):
         self._configurable = ConfigTimeLimit(env, time_limit)
         super().__init__(self._configurable, parent)
         assert self._cfgform is not None
-        main_layout = QVBoxLayout(self)
-        main_layout.addWidget(self._cfgform)
-        main_layout.addWidget(self._controls)
+        self._lay_out(self._cfgform)
 
     def timeLimit(self) -> int:  # pylint: disable=invalid-name
         return self._configurable.value
 
 
+_TIME_LIMIT_RANGE = (0, math.inf)
+_TIME_LIMIT_HELP = "Maximum number of steps per episode; set to 0 to disable time limit"
+
+
 class ConfigTimeLimit(gym.Wrapper, coi.Configurable):
     def __init__(self, env: gym.Env, initial_limit: t.Optional[int] = None) -> None:
         super().__init__(env)
@@ -249,10 +253,10 @@ class ConfigTimeLimit(gym.Wrapper, coi.Configurable):
         config.add(
             "TimeLimit_max_episode_steps",
             self.value,
-            range=(0, np.inf),
+            range=_TIME_LIMIT_RANGE,
             default=self.default_value,
             label="Time limit",
-            help="Maximum number of steps per episode; set to 0 to disable time limit",
+            help=_TIME_LIMIT_HELP,
         )
         return config
 
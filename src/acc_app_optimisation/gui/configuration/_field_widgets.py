@@ -6,6 +6,9 @@
 
 """Helpers to concisely create form widgets."""
 
+import functools
+import math
+import operator
 import os
 import typing as t
 from pathlib import Path
@@ -19,25 +22,59 @@ from . import _type_utils as _tu
 
 UnparsedDict = t.Dict[str, str]
 
+# Range of a C int, as used by `QSpinBox`.
+_INT_MIN = -(2 << 30)
+_INT_MAX = (2 << 30) - 1
+
+# Dialogs tend to contain many fields with the same range.
+_guess_decimals = functools.lru_cache(maxsize=256)(_tu.guess_decimals)
+
 
 def make_field_widget(field: Config.Field, values: UnparsedDict) -> QtWidgets.QWidget:
     """Given a field, pick the best widget to configure it."""
-    # pylint: disable = too-many-return-statements
-    setter = itemsetter(values, field.dest)
+    # Look up the exact type first. This skips the `isinstance()`
+    # checks in `_pick_field_widget_maker()`, in particular the
+    # comparatively slow one against the `os.PathLike` ABC.
+    value = field.value
+    maker = _FIELD_WIDGET_MAKERS.get(type(value))
+    if maker is None:
+        maker = _pick_field_widget_maker(value)
+    return maker(field, values)
+
+
+def _pick_field_widget_maker(value: t.Any) -> "_FieldWidgetMaker":
+    """Pick the function that `make_field_widget()` should call."""
     # Handle type-based decisions before argument-based ones.
-    if _tu.is_bool(field.value):
-        checkbox = make_checkbox(bool(field.value))
-        # `_state` is an integer with non-obvious semantics. Ignore it
-        # and use the obvious `isChecked` instead.
-        checkbox.stateChanged.connect(
-            lambda _state: setter(_tu.str_boolsafe(checkbox.isChecked()))
-        )
-        return checkbox
-    if isinstance(field.value, os.PathLike):
-        selector = make_file_selector(field.value, field.choices)
-        selector.fileChanged.connect(setter)
-        return selector
-    return _make_scalar_field_widget(field, values)
+    if _tu.is_bool(value):
+        return _make_bool_field_widget
+    if isinstance(value, os.PathLike):
+        return _make_path_field_widget
+    return _make_scalar_field_widget
+
+
+def _make_bool_field_widget(
+    field: Config.Field,
+    values: UnparsedDict,
+) -> QtWidgets.QWidget:
+    setter = itemsetter(values, field.dest)
+    checkbox = make_checkbox(bool(field.value))
+    # `_state` is an integer with non-obvious semantics. Ignore it
+    # and use the obvious `isChecked` instead. We already know that the
+    # value is a bool, so inline what `str_boolsafe()` would do.
+    checkbox.stateChanged.connect(
+        lambda _state: setter("checked" if checkbox.isChecked() else "")
+    )
+    return checkbox
+
+
+def _make_path_field_widget(
+    field: Config.Field,
+    values: UnparsedDict,
+) -> QtWidgets.QWidget:
+    setter = itemsetter(values, field.dest)
+    selector = make_file_selector(field.value, field.choices)
+    selector.fileChanged.connect(setter)
+    return selector
 
 
 def _make_scalar_field_widget(
@@ -51,26 +88,41 @@ def _make_scalar_field_widget(
     :func:`make_field_widget()`.
     """
     setter = itemsetter(values, field.dest)
-    if field.choices is not None:
-        combobox = make_combobox(str(field.value), map(str, field.choices))
+    value, choices, range_ = field.value, field.choices, field.range
+    if choices is not None:
+        combobox = make_combobox(str(value), [str(choice) for choice in choices])
         combobox.currentTextChanged.connect(setter)
         return combobox
-    if field.range is not None:
+    if range_ is not None:
         # Only make a spin box under when it makes sense. Otherwise,
         # fall through to the line edit case.
-        if _tu.is_int(field.value):
-            spinbox = make_int_spinbox(field.value, field.range)
+        if _tu.is_int(value):
+            spinbox = make_int_spinbox(value, range_)
             spinbox.valueChanged.connect(setter)
             return spinbox
-        if _tu.is_float(field.value) and not _tu.is_range_huge(*field.range):
-            double_spinbox = make_double_spinbox(field.value, field.range)
+        if _tu.is_float(value) and not _tu.is_range_huge(*range_):
+            double_spinbox = make_double_spinbox(value, range_)
             double_spinbox.valueChanged.connect(setter)
             return double_spinbox
-    lineedit = make_lineedit(field.value)
+    lineedit = make_lineedit(value)
     lineedit.editingFinished.connect(lambda: setter(lineedit.text()))
     return lineedit
 
 
+_FieldWidgetMaker = t.Callable[[Config.Field, UnparsedDict], QtWidgets.QWidget]
+
+# Exact types of the most common config values.
+_FIELD_WIDGET_MAKERS: t.Mapping[type, _FieldWidgetMaker] = {
+    bool: _make_bool_field_widget,
+    np.bool_: _make_bool_field_widget,
+    int: _make_scalar_field_widget,
+    np.int64: _make_scalar_field_widget,
+    float: _make_scalar_field_widget,
+    np.float64: _make_scalar_field_widget,
+    str: _make_scalar_field_widget,
+}
+
+
 def make_file_selector(
     value: os.PathLike, choices: t.Optional[t.Iterable[str]]
 ) -> FileSelector:
@@ -101,21 +153,35 @@ def make_lineedit(value: t.Any) -> QtWidgets.QLineEdit:
     """Create a line edit."""
     widget = QtWidgets.QLineEdit(str(value))
     if _tu.is_int(value):
-        widget.setValidator(QtGui.QIntValidator())
+        widget.setValidator(_get_shared_validator(QtGui.QIntValidator))
     elif _tu.is_float(value):
-        widget.setValidator(QtGui.QDoubleValidator())
+        widget.setValidator(_get_shared_validator(QtGui.QDoubleValidator))
     else:
         pass
     return widget
 
 
+@functools.lru_cache(maxsize=None)
+def _get_shared_validator(
+    validator_class: t.Type[QtGui.QValidator],
+) -> QtGui.QValidator:
+    """Return a default-constructed validator shared by all line edits.
+
+    Validators are stateless and may be set on any number of line
+    edits. The instance is created on first use without a parent. This
+    cache is its only owner and keeps it alive, so it also survives the
+    destruction of the `QApplication` (e.g. between tests).
+    """
+    return validator_class()
+
+
 def make_double_spinbox(
     value: float, range_: t.Tuple[float, float]
 ) -> QtWidgets.QDoubleSpinBox:
     """Create either an integer or a floating-point spin box."""
     low, high = range_
     widget = QtWidgets.QDoubleSpinBox()
-    widget.setDecimals(_tu.guess_decimals(low, high))
+    widget.setDecimals(_guess_decimals(low, high))
     widget.setStepType(widget.AdaptiveDecimalStepType)
     widget.setGroupSeparatorShown(True)
     widget.setRange(low, high)
@@ -127,8 +193,9 @@ def make_int_spinbox(value: int, range_: t.Tuple[int, int]) -> QtWidgets.QSpinBo
     """Create either an integer or a floating-point spin box."""
     # Ensure that the range limits are valid integers.
     low, high = range_
-    low = int(np.clip(np.floor(low), -(2 << 30), (2 << 30) - 1))
-    high = int(np.clip(np.ceil(high), -(2 << 30), (2 << 30) - 1))
+    # Clamp before rounding so that infinite limits don't overflow.
+    low = math.floor(min(max(low, _INT_MIN), _INT_MAX))
+    high = math.ceil(min(max(high, _INT_MIN), _INT_MAX))
     widget = QtWidgets.QSpinBox()
     widget.setStepType(widget.AdaptiveDecimalStepType)
     widget.setGroupSeparatorShown(True)
@@ -149,15 +216,12 @@ V = t.TypeVar("V")  # pylint: disable=invalid-name
 
 
 def itemsetter(mapping: t.MutableMapping[K, V], key: K) -> t.Callable[[V], None]:
-    """Return a callable that takes ``value`` and runs ``mapping[key] = value``."""
-
-    def _setter(value: V) -> None:
-        """Run ``{mapping}[{key}] = value``."""
-        mapping[key] = value
+    """Return a callable that takes ``value`` and runs ``mapping[key] = value``.
 
-    assert _setter.__doc__ is not None
-    _setter.__doc__ = _setter.__doc__.format(**locals())
-    return _setter
+    Unlike a closure, calling the result doesn't create a Python frame.
+    Its `repr()` still shows *mapping* and *key*.
+    """
+    return functools.partial(operator.setitem, mapping, key)
 
 
 def ensure_config_dir() -> t.Optional[Path]:
@@ -4,9 +4,13 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later OR EUPL-1.2+
 
+import functools
+import math
+import re
 import typing as t
 
-from PyQt5 import QtGui, QtWidgets
+import numpy as np
+from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtCore import Qt
 
 from ...utils.split_words import split_words_and_spaces
@@ -65,7 +69,7 @@ class SkeletonPointsViewWidget(BaseSkeletonPointsWidget):
         self.edit.setText(self._get_points_text())
 
     def _get_points_text(self) -> str:
-        return " ".join(map(str, self._points))
+        return _format_points(self._points)
 
 
 class SkeletonPointsEditWidget(BaseSkeletonPointsWidget):
@@ -85,58 +89,175 @@ class SkeletonPointsEditWidget(BaseSkeletonPointsWidget):
             "point. Separate points with whitespace.",
         )
         description.setWordWrap(True)
-        initial_text = " ".join(str(point) for point in points)
+        self._initial_text = _format_points(tuple(points))
         validator = WhitespaceDelimitedDoubleValidator()
         validator.setBottom(0.0)
-        self.edit = QtWidgets.QLineEdit(initial_text)
+        self.edit = QtWidgets.QLineEdit(self._initial_text)
         self.edit.setValidator(validator)
-        reset = QtWidgets.QPushButton("Reset")
-        reset.setEnabled(False)
-        reset.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        reset.clicked.connect(lambda: self.edit.setText(initial_text))
-        self.edit.textChanged.connect(
-            lambda text: reset.setEnabled(text != initial_text)
+        # Text and result of the last successful parse.
+        self._parsed: t.Optional[t.Tuple[str, t.Tuple[float, ...]]] = None
+        self._reset = QtWidgets.QPushButton("Reset")
+        self._reset.setEnabled(False)
+        self._reset.setSizePolicy(
+            QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed
         )
+        self._reset.clicked.connect(self._on_reset_clicked)
+        # Only user edits emit `textEdited`. Programmatic changes update
+        # the reset button themselves.
+        self.edit.textEdited.connect(self._update_reset_button)
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(description)
         layout.addWidget(self.edit)
-        layout.addWidget(reset, alignment=Qt.AlignRight)
+        layout.addWidget(self._reset, alignment=Qt.AlignRight)
         layout.addStretch(1)
 
+    def _on_reset_clicked(self) -> None:
+        self.edit.setText(self._initial_text)
+        self._reset.setEnabled(False)
+
+    def _update_reset_button(self, text: str) -> None:
+        self._reset.setEnabled(text != self._initial_text)
+
     def showEvent(self, _: QtGui.QShowEvent) -> None:
         """Pre-select the line edit upon becoming visible."""
         # pylint: disable = invalid-name
         self.edit.setFocus()
 
     def skeletonPoints(self) -> t.Tuple[float, ...]:
-        """Parse the skeleton points entered by the user."""
+        """Parse the skeleton points entered by the user.
+
+        The result is cached until the text changes.
+        """
+        text = self.edit.text()
+        if self._parsed and self._parsed[0] == text:
+            return self._parsed[1]
         locale = self.edit.validator().locale()
-        points: t.MutableSet[float] = set()
-        for word in self.edit.text().split():
-            point, success = locale.toDouble(word)
-            if not success:
-                raise ValueError(f"could not convert string to float: {word!r}")
-            points.add(point)
-        return tuple(sorted(points))
+        result = _parse_points_c_locale(text, locale)
+        if result is None:
+            words = text.split()
+            points = np.empty(len(words), dtype=float)
+            to_double = locale.toDouble
+            for i, word in enumerate(words):
+                point, success = to_double(word)
+                if not success:
+                    raise ValueError(f"could not convert string to float: {word!r}")
+                points[i] = point
+            result = _sorted_unique(points)
+        self._parsed = (text, result)
+        return result
 
     def setSkeletonPoints(self, points: t.Tuple[float, ...]) -> None:
         """Update the control to display the given points."""
-        self.edit.setText(" ".join(str(point) for point in points))
+        text = _format_points(tuple(points))
+        self.edit.setText(text)
+        self._update_reset_button(text)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_points(points: t.Tuple[float, ...]) -> str:
+    """Format skeleton points for display in a line edit.
+
+    This is cached because dialogs tend to get opened again and again
+    with the same points.
+    """
+    return " ".join(map(str, points))
+
+
+def _parse_points_c_locale(
+    text: str, locale: QtCore.QLocale
+) -> t.Optional[t.Tuple[float, ...]]:
+    """Parse, sort and deduplicate points with NumPy if it is safe.
+
+    NumPy is more lenient than `QLocale.toDouble()`: it also accepts
+    e.g. ``inf``, ``nan``, ``1_000``, non-ASCII digits and overflowing
+    numbers like ``1e400``. Hence, only use it if *locale* uses a
+    decimal point, *text* contains nothing but ASCII digits, signs,
+    exponents, decimal points and whitespace, and all results are
+    finite. Return None otherwise, or if NumPy fails to parse the text.
+    """
+    if (
+        locale.decimalPoint() != "."
+        or locale.groupSeparator() in text
+        or not _C_FLOAT_CHARS.fullmatch(text)
+    ):
+        return None
+    try:
+        points = np.array(text.split(), dtype=float)
+    except ValueError:
+        return None
+    if not np.all(np.isfinite(points)):
+        return None
+    return _sorted_unique(points)
+
+
+# Characters that may appear in a list of numbers that both NumPy and
+# `QLocale.c()` parse the same way.
+_C_FLOAT_CHARS = re.compile(r"[0-9.eE+\-\s]*", re.ASCII)
+
+
+def _sorted_unique(points: np.ndarray) -> t.Tuple[float, ...]:
+    """Sort and deduplicate *points* unless they already are."""
+    # Users usually enter points in increasing order. Checking this is
+    # cheaper than sorting.
+    if not np.all(points[1:] > points[:-1]):
+        points = np.unique(points)
+    return tuple(points.tolist())
+
+
+# Whole numbers of up to 15 digits, separated by single spaces. Any
+# such number is exactly representable as a double and far below the
+# top of its range.
+_DIGIT_WORDS = re.compile(r"[0-9]{1,15}(?: [0-9]{1,15})* ?")
 
 
 class WhitespaceDelimitedDoubleValidator(QtGui.QDoubleValidator):
     """A `QValidator` that accepts a list of doubles, delimited by whitespace."""
 
+    def __init__(self, *args: t.Any) -> None:
+        super().__init__(*args)
+        # Qt often validates the same input several times in a row.
+        # Remember the last call and drop it whenever the validator's
+        # settings (range, locale, …) change.
+        self._last_call: t.Optional[
+            t.Tuple[str, int, t.Tuple[QtGui.QValidator.State, str, int]]
+        ] = None
+        self.changed.connect(self._forget_last_call)
+
+    def _forget_last_call(self) -> None:
+        self._last_call = None
+
     def validate(
         self, text: str, pos: int
     ) -> t.Tuple[QtGui.QValidator.State, str, int]:
         "Implementation of `QValidator.validate()`."
+        last_call = self._last_call
+        if last_call and last_call[0] == text and last_call[1] == pos:
+            return last_call[2]
+        result = self._validate(text, pos)
+        self._last_call = (text, pos, result)
+        return result
+
+    def _validate(
+        self, text: str, pos: int
+    ) -> t.Tuple[QtGui.QValidator.State, str, int]:
+        # Fast path for the most common input: short whole numbers
+        # separated by single spaces. We'd leave this input unchanged and
+        # `QDoubleValidator` accepts it if it uses ASCII digits and
+        # permits all non-negative numbers.
+        if (
+            _DIGIT_WORDS.fullmatch(text)
+            and self.bottom() <= 0.0
+            and self.top() == math.inf
+            and self.locale().zeroDigit() == "0"
+        ):
+            return QtGui.QValidator.Acceptable, text, pos
         parts = []
         # Start out with the best validator state: acceptable. As we go
         # through the numbers, the state can only get worse:
         # intermediate if the input looks like we caught the user
         # mid-typing, invalid if the input is flat-out wrong.
         final_state = QtGui.QValidator.Acceptable
+        only_spaces = True
         # Tokenize the input, split it into pure whitespace and pure
         # floats.
         for token in split_words_and_spaces(text):
@@ -154,6 +275,7 @@ class WhitespaceDelimitedDoubleValidator(QtGui.QDoubleValidator):
                 rel_pos = pos - token.begin
                 state, part, rel_pos = super().validate(token.text, rel_pos)
                 pos = token.begin + rel_pos
+                only_spaces = only_spaces and part.isspace()
             else:
                 # Word, cursor outside the word: Only adjust cursor
                 # position if it is behind this word. If it is before,
@@ -161,10 +283,11 @@ class WhitespaceDelimitedDoubleValidator(QtGui.QDoubleValidator):
                 state, part, _ = super().validate(token.text, 0)
                 if pos > token.begin:
                     pos += len(part) - len(token.text)
+                only_spaces = only_spaces and part.isspace()
             parts.append(part)
             final_state = min(final_state, state)
         # Final adjustment: If the text consists of nothing _but_
         # whitespace, we just discard it.
-        if all(part.isspace() for part in parts):
-            parts.clear()
+        if only_spaces:
+            return final_state, "", pos
         return final_state, "".join(parts), pos
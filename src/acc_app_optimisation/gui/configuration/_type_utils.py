@@ -6,6 +6,7 @@
 
 """Utility functions to understand types and value ranges."""
 
+import math
 import typing as t
 
 import numpy as np
@@ -34,6 +35,12 @@ def str_boolsafe(value: t.Any) -> str:
     ``"checked"`` or ``""`` (the empty string). For all other types, it
     simply returns ``str(value)``.
     """
+    cls = type(value)
+    # Shortcut the common built-in types before the bool check.
+    if cls is str:
+        return value
+    if cls is int or cls is float:
+        return str(value)
     if is_bool(value):
         return "checked" if value else ""
     return str(value)
@@ -43,9 +50,21 @@ def guess_decimals(low: float, high: float) -> int:
     """Guess how many decimals to show in a double spin box."""
     absmax = max(abs(high), abs(low))
     absmin = min(abs(high), abs(low))
-    mindigits = np.ceil(-np.log10(absmin)) if absmin else 0
-    maxdigits = np.ceil(-np.log10(absmax)) if absmax else 0
-    return 1 + int(max(2, maxdigits, mindigits))
+    mindigits = _leading_zero_digits(absmin)
+    maxdigits = _leading_zero_digits(absmax)
+    return 1 + max(2, maxdigits, mindigits)
+
+
+def _leading_zero_digits(value: float) -> int:
+    """Return ``ceil(-log10(value))``, or 0 if that isn't finite.
+
+    This uses `math` instead of NumPy because it only ever receives
+    scalars. Unlike `math.ceil()`, it does not raise for infinities or
+    NaN; these never win in `guess_decimals()` anyway.
+    """
+    if value and math.isfinite(value):
+        return math.ceil(-math.log10(value))
+    return 0
 
 
 def is_range_huge(low: float, high: float) -> bool:
@@ -53,20 +72,30 @@ def is_range_huge(low: float, high: float) -> bool:
     absmax = max(abs(high), abs(low))
     absmin = min(abs(high), abs(low))
     if absmin == 0.0:
-        absmax, absmin = (absmax, 1.0) if absmax > 1.0 else (1.0, absmax)
-    return absmax / absmin > 1e3
+        # Compare against 1 instead, whichever side of it absmax is on.
+        return absmax > 1e3 or absmax < 1e-3
+    # Same as `absmax / absmin > 1e3`, but without the division.
+    return absmax > 1e3 * absmin
+
+
+_INT_TYPES = (int, np.integer)
+_FLOAT_TYPES = (float, np.floating)
+_BOOL_TYPES = (bool, np.bool_)
+
+# The predicates below first compare against the built-in type, which
+# is the most common case and cheaper than the subclass check.
 
 
 def is_int(value: t.Any) -> bool:
     """Return True if `value` is a Python or NumPy int."""
-    return isinstance(value, (int, np.integer))
+    return type(value) is int or isinstance(value, _INT_TYPES)
 
 
 def is_float(value: t.Any) -> bool:
     """Return True if `value` is a Python or NumPy float."""
-    return isinstance(value, (float, np.floating))
+    return type(value) is float or isinstance(value, _FLOAT_TYPES)
 
 
 def is_bool(value: t.Any) -> bool:
     """Return True if `value` is a Python or NumPy bool."""
-    return isinstance(value, (bool, np.bool_))
+    return type(value) is bool or isinstance(value, _BOOL_TYPES)
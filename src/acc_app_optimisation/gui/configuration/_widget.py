@@ -13,6 +13,7 @@ from types import SimpleNamespace
 from cernml import coi
 from PyQt5.QtWidgets import QFormLayout, QLabel, QWidget
 
+from ...utils.disabled_updates import disabled_updates
 from ._field_widgets import make_field_widget
 from ._type_utils import str_boolsafe
 
@@ -34,16 +35,18 @@ class ConfigureWidget(QWidget):
     ) -> None:
         super().__init__(parent)
         self._config = config
-        self._current_values = {
-            field.dest: str_boolsafe(field.value) for field in self._config.fields()
-        }
+        self._current_values: t.Dict[str, str] = {}
+        # Snapshot of `_current_values` and the result of validating it.
+        self._validated: t.Optional[t.Tuple[t.Tuple[str, ...], SimpleNamespace]] = None
         params_layout = QFormLayout(self)
-        for field in self._config.fields():
-            label = QLabel(field.label)
-            widget = make_field_widget(field, self._current_values)
-            if field.help is not None:
-                widget.setToolTip(field.help)
-            params_layout.addRow(label, widget)
+        with disabled_updates(self):
+            for field in self._config.fields():
+                self._current_values[field.dest] = str_boolsafe(field.value)
+                label = QLabel(field.label)
+                widget = make_field_widget(field, self._current_values)
+                if field.help is not None:
+                    widget.setToolTip(field.help)
+                params_layout.addRow(label, widget)
 
     def config(self) -> coi.Config:
         """Return the config that created this widget."""
@@ -56,8 +59,16 @@ class ConfigureWidget(QWidget):
         still have to pass these values to
         `coi.Configurable.apply_config()`, which may fail.
 
+        Validation results are cached until the user changes a value,
+        so that e.g. clicking Apply and then OK validates only once.
+
         Raises:
             coi.BadConfig: if the values currently in the widget fail
                 validation.
         """
-        return self._config.validate_all(self._current_values)
+        key = tuple(self._current_values.values())
+        if self._validated is None or self._validated[0] != key:
+            values = self._config.validate_all(self._current_values)
+            self._validated = (key, values)
+        # Hand out a copy; callers are free to modify it.
+        return SimpleNamespace(**vars(self._validated[1]))
@@ -9,6 +9,7 @@ from __future__ import annotations
 import abc
 import contextlib
 import sys
+import threading
 import traceback
 import typing as t
 
@@ -19,6 +20,8 @@ if t.TYPE_CHECKING:
     # pylint: disable = unused-import
     from logging import Logger
 
+    from matplotlib.figure import Figure
+
 
 class BenignCancelledError(cancellation.CancelledError):
     """Cancellation error that we raise, not the optimization problem."""
@@ -77,6 +80,57 @@ class Job(QtCore.QRunnable):
         self._token_source.cancel()
 
 
+class FigureDrawer(QtCore.QObject):
+    """Helper that draws Matplotlib figures on the main thread.
+
+    Drawing a figure is expensive (layout and Agg rasterization) and
+    should not block the worker thread that runs the optimization. This
+    object must be created on the main thread. Jobs then call
+    :py:meth:`request_draw()` from their worker thread, which schedules
+    the actual drawing on the main thread's event loop.
+
+    Jobs must hold :py:attr:`lock` while they let the optimization
+    problem modify its figures (i.e. while calling ``render()``). The
+    main thread holds the same lock while drawing. This prevents the
+    race condition where one thread modifies a figure that the other
+    one is drawing.
+
+    Note that this only protects ``render()``. Jobs do not hold the
+    lock during the rest of a step (e.g. ``compute_single_objective()``
+    or ``step()``), since these may take a long time and the main
+    thread would be blocked for as long. Problems that modify their
+    figures outside of ``render()`` may still race with drawing.
+
+    Requests are coalesced: if a draw is already pending, further
+    requests are dropped, since the pending draw will pick up the latest
+    state of all figures anyway.
+    """
+
+    _draw_requested = QtCore.pyqtSignal(list)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = threading.Lock()
+        self._pending = threading.Event()
+        # The signal is emitted from worker threads, so the default
+        # connection type queues the call to the main thread.
+        self._draw_requested.connect(self._draw)
+
+    def request_draw(self, figures: t.Iterable[Figure]) -> None:
+        """Schedule drawing the given figures on the main thread."""
+        if self._pending.is_set():
+            return
+        self._pending.set()
+        self._draw_requested.emit(list(figures))
+
+    @QtCore.pyqtSlot(list)
+    def _draw(self, figures: t.List[Figure]) -> None:
+        self._pending.clear()
+        with self.lock:
+            for figure in figures:
+                figure.canvas.draw()
+
+
 @contextlib.contextmanager
 def catching_exceptions(
     name: str,
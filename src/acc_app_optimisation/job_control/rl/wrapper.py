@@ -13,7 +13,9 @@ import gymnasium as gym
 import numpy as np
 from cernml.coi import cancellation
 from cernml.mpl_utils import iter_matplotlib_figures
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from ..base import FigureDrawer
 
 if sys.version_info < (3, 10):
     from typing_extensions import Self
@@ -139,6 +141,7 @@ class RenderWrapper(gym.Wrapper):
         self.reward_lists: t.List[t.List[float]] = []
         self.signals = signals
         self.cancellation_token = cancellation_token
+        self._drawer = FigureDrawer()
 
     def reset(self, **kwargs: t.Any) -> np.ndarray:
         self.cancellation_token.raise_if_cancellation_requested()
@@ -177,12 +180,11 @@ class RenderWrapper(gym.Wrapper):
 
         if "matplotlib_figures" not in render_modes:
             return
-        figures = self.render("matplotlib_figures")
-        # `draw()` refreshes the figures immediately on this thread. Do
-        # not use `draw_idle()`: it postpones drawing until the next
-        # time the (main thread) event loop runs. This leads to a race
-        # condition between the main thread drawing the figures and this
-        # thread modifying them.
-        for _, figure in iter_matplotlib_figures(figures):
-            QThread.yieldCurrentThread()
-            figure.canvas.draw()
+        # Drawing happens on the main thread. Hold the drawer's lock
+        # while the env updates its figures so that the main thread
+        # never draws a half-modified figure.
+        with self._drawer.lock:
+            figures = self.render("matplotlib_figures")
+        self._drawer.request_draw(
+            figure for _, figure in iter_matplotlib_figures(figures)
+        )
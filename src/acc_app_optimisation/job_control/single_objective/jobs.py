@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later OR EUPL-1.2+
 
+import time
 import traceback
 import typing as t
 from dataclasses import dataclass
@@ -19,12 +20,16 @@ from PyQt5 import QtCore
 from ...envs import Metadata
 from ...utils.bounded import BoundedArray
 from ...utils.typecheck import AnyOptimizable
-from ..base import BenignCancelledError, Job, catching_exceptions
+from ..base import BenignCancelledError, FigureDrawer, Job, catching_exceptions
 from . import constraints
 from .skeleton_points import SkeletonPoints
 
 LOG = getLogger(__name__)
 
+# Minimum time between two calls to `QThread.yieldCurrentThread()` in
+# seconds. This is about one frame of a 60 Hz display.
+YIELD_INTERVAL = 0.016
+
 
 class BadInitialPoint(Exception):
     """The initial point has not the correct shape or type."""
@@ -150,9 +155,30 @@ class OptJob(Job):
             for c in problem.constraints
         ]
         self._signals = signals
-        self.objectives_log: t.List[float] = []
-        self.actions_log: t.List[np.ndarray] = []
-        self.constraints_log: t.List[np.ndarray] = []
+        self._drawer = FigureDrawer()
+        self._last_yield = 0.0
+        self._bounds_cache: t.Optional[
+            t.Tuple[gym.spaces.Box, np.ndarray, np.ndarray]
+        ] = None
+        self._objectives = _RowBuffer()
+        self._actions = _RowBuffer()
+        self._constraints = _RowBuffer()
+        self._iterations = np.arange(64)
+
+    @property
+    def objectives_log(self) -> np.ndarray:
+        """1D array of all objective values evaluated so far."""
+        return self._objectives.view()
+
+    @property
+    def actions_log(self) -> np.ndarray:
+        """2D array of all actions evaluated so far, one per row."""
+        return self._actions.view()
+
+    @property
+    def constraints_log(self) -> np.ndarray:
+        """2D array of all constraint values so far, one step per row."""
+        return self._constraints.view()
 
     @property
     def optimizer_id(self) -> str:
@@ -226,18 +252,19 @@ class OptJob(Job):
         """
         if self._token_source.token.cancellation_requested:
             raise BenignCancelledError()
-        # Yield at least once per optimization step. This releases
-        # Python's Global Interpreter Lock (GIL) and gives the main
-        # thread a chance to process GUI events.
-        QtCore.QThread.yieldCurrentThread()
+        self._maybe_yield()
         # Clip parameters into the valid range – COBYLA might otherwise go
         # out-of-bounds.
-        opt_space = self.get_optimization_space()
-        action = np.clip(action, opt_space.low, opt_space.high)
+        low, high = self._get_clip_bounds()
+        action = np.clip(action, low, high)
         self._signals.step_started.emit(PreStepMetadata(action.copy(), final_step))
         # Calculate loss function.
         loss = self.compute_loss(action.copy())
-        assert np.ndim(loss) == 0, "non-scalar loss"
+        # Check the common scalar types first to skip NumPy's dispatch
+        # in the hot path. Like any assert, this vanishes under `-O`.
+        assert isinstance(loss, (int, float, np.generic)) or (np.ndim(loss) == 0), (
+            "non-scalar loss"
+        )
         if self.wrapped_constraints:
             constraints_values = all_into_flat_array(
                 constraint.fun(action) for constraint in self.wrapped_constraints
@@ -247,24 +274,61 @@ class OptJob(Job):
         # Log inputs and outputs. Only adjust the logs after all user
         # functions have been called. Otherwise, we risk unequal lengths
         # between the log arrays.
-        self.actions_log.append(action.flatten())
-        self.objectives_log.append(loss)
+        self._actions.append(action.ravel())
+        self._objectives.append(loss)
         if self.wrapped_constraints:
-            self.constraints_log.append(constraints_values)
+            self._constraints.append(constraints_values)
         self._emit_all_signals()
         self._render_env()
         # Clear all constraint caches.
         return loss
 
+    def _get_clip_bounds(self) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return the bounds of the optimization space for clipping.
+
+        The bounds are converted to contiguous float64 arrays (the dtype
+        in which optimizers pass their actions) so that `np.clip()` need
+        not convert them on every step. The conversion is cached for as long
+        as the problem keeps returning the same space object.
+        """
+        space = self.get_optimization_space()
+        cache = self._bounds_cache
+        if cache is None or cache[0] is not space:
+            cache = self._bounds_cache = (
+                space,
+                np.ascontiguousarray(space.low, dtype=np.float64),
+                np.ascontiguousarray(space.high, dtype=np.float64),
+            )
+        return cache[1], cache[2]
+
+    def _maybe_yield(self) -> None:
+        """Yield to other threads if we haven't done so recently.
+
+        This releases Python's Global Interpreter Lock (GIL) and gives
+        the main thread a chance to process GUI events. Because the GUI
+        cannot make use of more than one chance per frame, we skip the
+        (comparatively expensive) system call for very fast problems.
+        """
+        now = time.monotonic()
+        if now - self._last_yield > YIELD_INTERVAL:
+            self._last_yield = now
+            QtCore.QThread.yieldCurrentThread()
+
     def _emit_all_signals(self) -> None:
-        iterations = np.arange(len(self.objectives_log))
-        self._signals.objective_updated.emit(iterations, np.array(self.objectives_log))
-        self._signals.actors_updated.emit(iterations, np.array(self.actions_log))
+        # The logs and iteration indices are views into buffers that
+        # are never modified in place. Rows that have been emitted stay
+        # the same, so the receivers may safely hold onto them.
+        num_steps = len(self._objectives)
+        if len(self._iterations) < num_steps:
+            self._iterations = np.arange(2 * num_steps)
+        iterations = self._iterations[:num_steps]
+        self._signals.objective_updated.emit(iterations, self.objectives_log)
+        self._signals.actors_updated.emit(iterations, self.actions_log)
         if self.wrapped_constraints:
             self._signals.constraints_updated.emit(
                 iterations,
                 BoundedArray(
-                    values=np.array(self.constraints_log),
+                    values=self.constraints_log,
                     lower=all_into_flat_array(c.lb for c in self.wrapped_constraints),
                     upper=all_into_flat_array(c.ub for c in self.wrapped_constraints),
                 ),
@@ -273,15 +337,15 @@ class OptJob(Job):
     def _render_env(self) -> None:
         if "matplotlib_figures" not in Metadata(self.problem).render_modes:
             return
-        figures = self.problem.render(mode="matplotlib_figures")
-        # `draw()` refreshes the figures immediately on this thread. Do
-        # not use `draw_idle()`: it postpones drawing until the next
-        # time the (main thread) event loop runs. This leads to a race
-        # condition between the main thread drawing the figures and this
-        # thread modifying them.
-        for _, figure in iter_matplotlib_figures(figures):
-            QtCore.QThread.yieldCurrentThread()
-            figure.canvas.draw()
+        # Drawing happens on the main thread. Hold the drawer's lock
+        # while the problem updates its figures so that the main thread
+        # never draws a half-modified figure. Do not use `draw_idle()`:
+        # it does not take the lock.
+        with self._drawer.lock:
+            figures = self.problem.render(mode="matplotlib_figures")
+        self._drawer.request_draw(
+            figure for _, figure in iter_matplotlib_figures(figures)
+        )
 
 
 class SingleOptimizableJob(OptJob):
@@ -515,6 +579,46 @@ class FunctionOptimizableJob(OptJob):
         return str(self.problem.get_objective_function_name()) or "Objective function"
 
 
+class _RowBuffer:
+    """Append-only float array that grows by doubling its capacity.
+
+    This keeps the logs of `OptJob` in contiguous memory. Appending is
+    amortized O(1) and reading is a cheap view instead of a fresh
+    concatenation of all rows on every step.
+
+    The shape of each row is fixed by the first call to
+    :py:meth:`append()`. Scalars give a 1D buffer, 1D arrays a 2D one.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._initial_capacity = capacity
+        self._data: t.Optional[np.ndarray] = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, row: t.Union[float, np.ndarray]) -> None:
+        """Add a row to the end of the buffer."""
+        data = self._data
+        if data is None:
+            shape = np.shape(row)
+            data = np.empty((self._initial_capacity, *shape), dtype=np.float64)
+        elif self._len == len(data):
+            grown = np.empty((2 * len(data), *data.shape[1:]), dtype=data.dtype)
+            grown[: self._len] = data
+            data = grown
+        data[self._len] = row
+        self._data = data
+        self._len += 1
+
+    def view(self) -> np.ndarray:
+        """Return a view of all rows appended so far."""
+        if self._data is None:
+            return np.empty((0,), dtype=np.float64)
+        return self._data[: self._len]
+
+
 def validate_x0(array: np.ndarray) -> np.ndarray:
     """Raise BadInitialPoint if array is not a flat floating-point array."""
     array = np.asanyarray(array)
@@ -11,6 +11,7 @@
 
 """Tests for `acc_app_optimisation.foreign_imports`."""
 
+import importlib.machinery
 import sys
 import typing as t
 from dataclasses import dataclass
@@ -103,6 +104,67 @@ def test_double_import(
     assert first is second
 
 
+def test_root_spec_is_cached(
+    sys_modules: t.Dict[str, ModuleType], fake_module: FakePackage
+) -> None:
+    # pylint: disable=protected-access
+    cache_info = foreign_imports._find_root_spec_cached.cache_info
+    hits = cache_info().hits
+    first: t.Any = foreign_imports.import_from_path(str(fake_module.path))
+    del sys_modules[fake_module.name]
+    second: t.Any = foreign_imports.import_from_path(str(fake_module.path))
+    assert first is not second
+    assert cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize("fixture", ["fake_module", "fake_package"])
+def test_root_spec_fast_path(request: pytest.FixtureRequest, fixture: str) -> None:
+    # pylint: disable=protected-access
+    fake: FakePackage = request.getfixturevalue(fixture)
+    name = fake.path.stem
+    expected = importlib.machinery.PathFinder.find_spec(name, [str(fake.path.parent)])
+    spec = foreign_imports._scan_for_simple_spec(name, str(fake.path.parent))
+    assert expected is not None
+    assert spec is not None
+    assert spec.name == expected.name
+    assert spec.origin == expected.origin
+    assert spec.submodule_search_locations == expected.submodule_search_locations
+
+
+def test_reimport_is_cached(
+    monkeypatch: pytest.MonkeyPatch,
+    sys_modules: t.Dict[str, ModuleType],
+    fake_module: FakePackage,
+) -> None:
+    backup = Mock(wraps=foreign_imports.BackupModules)
+    monkeypatch.setattr(foreign_imports, "BackupModules", backup)
+    first: t.Any = foreign_imports.import_from_path(str(fake_module.path))
+    second: t.Any = foreign_imports.import_from_path(str(fake_module.path))
+    assert first is second
+    backup.assert_called_once()
+
+
+def test_reimport_cache_respects_cwd(
+    monkeypatch: pytest.MonkeyPatch,
+    sys_modules: t.Dict[str, ModuleType],
+    fake_module: FakePackage,
+) -> None:
+    monkeypatch.chdir(fake_module.path.parent)
+    foreign_imports.import_from_path(fake_module.path.name)
+    monkeypatch.chdir(fake_module.path.parent.parent)
+    with pytest.raises(ModuleNotFoundError):
+        foreign_imports.import_from_path(fake_module.path.name)
+
+
+def test_reimport_of_deleted_file_fails(
+    sys_modules: t.Dict[str, ModuleType], fake_module: FakePackage
+) -> None:
+    foreign_imports.import_from_path(str(fake_module.path))
+    fake_module.path.unlink()
+    with pytest.raises(ModuleNotFoundError):
+        foreign_imports.import_from_path(str(fake_module.path))
+
+
 def test_import_package(
     sys_modules: t.Dict[str, ModuleType], fake_package: FakePackage
 ) -> None:
@@ -233,6 +295,7 @@ def test_child_module_not_found(
         ("foo", PurePosixPath("foo"), ()),
         ("foo::bar", PurePosixPath("foo"), ("bar",)),
         ("foo::bar::baz", PurePosixPath("foo"), ("bar", "baz")),
+        ("foo:::bar", PurePosixPath("foo:"), ("bar",)),
         ("foo/bar", PurePosixPath("foo/bar"), ()),
         ("foo::bar/", PurePosixPath("foo::bar"), ()),
         ("foo::bar/::bar::baz", PurePosixPath("foo::bar"), ("bar", "baz")),
@@ -96,3 +96,44 @@ def test_runner(
     optimizable.get_initial_params.assert_called_once_with()  # type:ignore
     steps = optimizable.compute_single_objective.call_count  # type:ignore
     assert steps >= 5
+
+
+@pytest.mark.parametrize("with_constraints", [True, False])
+def test_logs_grow_past_initial_capacity(
+    monkeypatch: pytest.MonkeyPatch,
+    optimizable: cernml.coi.SingleOptimizable,
+    *,
+    with_constraints: bool,
+) -> None:
+    # Given:
+    num_steps = 100  # more than the 64 rows that the logs start out with
+    if with_constraints:
+        optimizable.constraints = [
+            NonlinearConstraint(lambda x: x[0], 0.0, 1.0),
+            NonlinearConstraint(lambda x: 2.0 * x, 0.0, 1.0),
+        ]
+    else:
+        optimizable.constraints = []
+    coi_spec = Mock("cernml.coi.spec", return_value=optimizable.spec)
+    monkeypatch.setattr("cernml.coi.spec", coi_spec)
+    job_builder = OptJobBuilder()
+    job_builder.problem_id = optimizable.spec.id  # type:ignore
+    job_builder.optimizer = make(next(iter(registry.keys())))
+    job = job_builder.build_job()
+    points = np.linspace(-1.0, 1.0, num=3 * num_steps).reshape(num_steps, 3)
+    # When:
+    for point in points:
+        job.x_0 = point  # type:ignore
+        job.reset()
+    # Then:
+    assert job.actions_log.shape == (num_steps, 3)
+    np.testing.assert_array_equal(job.actions_log, points)
+    assert job.objectives_log.shape == (num_steps,)
+    np.testing.assert_allclose(job.objectives_log, np.linalg.norm(points, axis=1))
+    if with_constraints:
+        assert job.constraints_log.shape == (num_steps, 4)
+        np.testing.assert_array_equal(
+            job.constraints_log, np.column_stack([points[:, 0], 2.0 * points])
+        )
+    else:
+        assert job.constraints_log.shape == (0,)
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2020-2023 CERN
+# SPDX-FileCopyrightText: 2023 GSI Helmholtzzentrum für Schwerionenforschung
+# SPDX-FileNotice: All rights not expressly granted are reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later OR EUPL-1.2+
+
+# pylint: disable = missing-function-docstring
+# pylint: disable = missing-class-docstring
+# pylint: disable = import-outside-toplevel
+# pylint: disable = redefined-outer-name
+
+"""Tests for `acc_app_optimisation.gui.configuration._skeleton_points`."""
+
+import re
+
+import pytest
+
+# pylint: disable = wrong-import-position
+pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5 import QtCore, QtWidgets  # noqa: E402
+
+from acc_app_optimisation.gui.configuration import _skeleton_points  # noqa: E402
+
+
+@pytest.fixture
+def validator(
+    qapp: QtWidgets.QApplication,
+) -> _skeleton_points.WhitespaceDelimitedDoubleValidator:
+    validator = _skeleton_points.WhitespaceDelimitedDoubleValidator()
+    validator.setLocale(QtCore.QLocale.c())
+    # Same settings as in `SkeletonPointsEditWidget`.
+    validator.setBottom(0.0)
+    return validator
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "0",
+        "7",
+        "10 20 30",
+        "10 20 30 ",
+        "007 1",
+        "1" * 15,
+        "1" * 16,
+        "1" * 15 + " " + "1" * 16,
+        "9" * 400,
+    ],
+)
+def test_fast_path_agrees_with_slow_path(
+    monkeypatch: pytest.MonkeyPatch,
+    validator: _skeleton_points.WhitespaceDelimitedDoubleValidator,
+    text: str,
+) -> None:
+    # pylint: disable = protected-access
+    fast_state, _, _ = validator.validate(text, len(text))
+    monkeypatch.setattr(_skeleton_points, "_DIGIT_WORDS", re.compile(r"(?!)"))
+    slow_state, _, _ = validator._validate(text, len(text))
+    assert fast_state == slow_state
+
+
+@pytest.mark.parametrize("word", ["1e400", "inf", "nan", "1_000", "١"])
+def test_points_that_qlocale_rejects(qapp: QtWidgets.QApplication, word: str) -> None:
+    widget = _skeleton_points.SkeletonPointsEditWidget((1.0,))
+    widget.edit.validator().setLocale(QtCore.QLocale.c())
+    widget.edit.setText(f"1 {word}")
+    with pytest.raises(ValueError, match="could not convert"):
+        widget.skeletonPoints()
@@ -6,13 +6,19 @@
 
 """Translate accelerator names between various domains."""
 
+from __future__ import annotations
+
+import functools
 import typing as t
+from types import MappingProxyType
 
-import pyjapc
 from accwidgets.lsa_selector import LsaSelectorAccelerator
 from accwidgets.timing_bar import TimingBarDomain
 from cernml import coi
-from pylogbook import NamedActivity
+
+if t.TYPE_CHECKING:
+    import pyjapc
+    from pylogbook import NamedActivity
 
 
 class InitialSelection:
@@ -78,6 +84,9 @@ class InitialSelection:
             for initialization data. If no machine is selected, AD is
             contacted. This ensures that InCA is always available.
         """
+        # pylint: disable = import-outside-toplevel
+        import pyjapc
+
         inca_accelerator = self.machine and machine_to_inca_server(self.machine)
         return pyjapc.PyJapc(
             selector=self.user,
@@ -86,6 +95,9 @@ class InitialSelection:
         )
 
 
+_MACHINES_BY_NAME: t.Final = coi.Machine.__members__
+
+
 def _deduce_machine(
     machine: t.Optional[str],
     timing_domain: t.Optional[TimingBarDomain],
@@ -93,7 +105,11 @@ def _deduce_machine(
 ) -> coi.Machine:
     if machine:
         # If this fails, we don't want to try other options.
-        return coi.Machine[machine.upper()]
+        name = machine.upper()
+        translated_machine = _MACHINES_BY_NAME.get(name)
+        if translated_machine is None:
+            raise KeyError(name)
+        return translated_machine
     if timing_domain:
         translated_machine = timing_domain_to_machine(timing_domain)
         if not translated_machine:
@@ -102,12 +118,12 @@ def _deduce_machine(
             )
         return translated_machine
     if lsa_server:
-        try:
-            translated_machine = lsa_server_to_machine(lsa_server)
-        except KeyError:
-            raise ValueError(
-                f"no machine found for LSA server {lsa_server.upper()!r}"
-            ) from None
+        # Check for unsupported servers directly instead of catching the
+        # `KeyError` raised by `lsa_server_to_machine()`.
+        server = lsa_server.lower()
+        if server in _UNSUPPORTED_LSA_SERVERS:
+            raise ValueError(f"no machine found for LSA server {server.upper()!r}")
+        translated_machine = _LSA_SERVER_TO_MACHINE.get(server)
         if translated_machine:
             return translated_machine
         # Fall through.
@@ -174,13 +190,8 @@ def _assert_consistent_lsa_accelerator(machine: coi.Machine, lsa_server: str) ->
         )
 
 
-def machine_to_inca_server(machine: coi.Machine) -> t.Optional[str]:
-    """Return the InCA server to contact for a given machine.
-
-    Note that the mapping is surjective: some machines map to the same
-    domain.
-    """
-    return {
+_MACHINE_TO_INCA_SERVER: t.Final = MappingProxyType(
+    {
         coi.Machine.NO_MACHINE: None,
         coi.Machine.LINAC_2: "PSB",
         coi.Machine.LINAC_3: "LEIR",
@@ -194,16 +205,21 @@ def machine_to_inca_server(machine: coi.Machine) -> t.Optional[str]:
         coi.Machine.ISOLDE: "ISOLDE",
         coi.Machine.AD: "AD",
         coi.Machine.ELENA: "ELENA",
-    }.get(machine)
+    }
+)
 
 
-def machine_to_timing_domain(machine: coi.Machine) -> t.Optional[TimingBarDomain]:
-    """Return the timing domain for a given CERN machine.
+def machine_to_inca_server(machine: coi.Machine) -> t.Optional[str]:
+    """Return the InCA server to contact for a given machine.
 
     Note that the mapping is surjective: some machines map to the same
     domain.
     """
-    return {
+    return _MACHINE_TO_INCA_SERVER.get(machine)
+
+
+_MACHINE_TO_TIMING_DOMAIN: t.Final = MappingProxyType(
+    {
         coi.Machine.NO_MACHINE: None,
         coi.Machine.LINAC_2: TimingBarDomain.PSB,
         coi.Machine.LINAC_3: TimingBarDomain.LEI,
@@ -217,7 +233,46 @@ def machine_to_timing_domain(machine: coi.Machine) -> t.Optional[TimingBarDomain
         coi.Machine.ISOLDE: None,
         coi.Machine.AD: TimingBarDomain.ADE,
         coi.Machine.ELENA: TimingBarDomain.LNA,
-    }.get(machine)
+    }
+)
+
+
+def machine_to_timing_domain(machine: coi.Machine) -> t.Optional[TimingBarDomain]:
+    """Return the timing domain for a given CERN machine.
+
+    Note that the mapping is surjective: some machines map to the same
+    domain.
+    """
+    return _MACHINE_TO_TIMING_DOMAIN.get(machine)
+
+
+def _invert_timing_table(
+    machines: t.Iterable[coi.Machine],
+) -> t.Mapping[TimingBarDomain, coi.Machine]:
+    """Build the reverse of `_MACHINE_TO_TIMING_DOMAIN`.
+
+    If several machines share a timing domain, the first one in
+    *machines* wins.
+    """
+    result: t.Dict[TimingBarDomain, coi.Machine] = {}
+    for machine in machines:
+        domain = _MACHINE_TO_TIMING_DOMAIN[machine]
+        if domain is not None:
+            result.setdefault(domain, machine)
+    return MappingProxyType(result)
+
+
+_TIMING_DOMAIN_TO_MACHINE: t.Final = _invert_timing_table(
+    [
+        coi.Machine.LHC,
+        coi.Machine.SPS,
+        coi.Machine.PS,
+        coi.Machine.PSB,
+        coi.Machine.ELENA,
+        coi.Machine.LEIR,
+        coi.Machine.AD,
+    ]
+)
 
 
 def timing_domain_to_machine(domain: TimingBarDomain) -> t.Optional[coi.Machine]:
@@ -225,15 +280,10 @@ def timing_domain_to_machine(domain: TimingBarDomain) -> t.Optional[coi.Machine]
 
     Note that the mapping is injective: not every machine is returned.
     """
-    return {
-        TimingBarDomain.LHC: coi.Machine.LHC,
-        TimingBarDomain.SPS: coi.Machine.SPS,
-        TimingBarDomain.CPS: coi.Machine.PS,
-        TimingBarDomain.PSB: coi.Machine.PSB,
-        TimingBarDomain.LNA: coi.Machine.ELENA,
-        TimingBarDomain.LEI: coi.Machine.LEIR,
-        TimingBarDomain.ADE: coi.Machine.AD,
-    }.get(domain)
+    return _TIMING_DOMAIN_TO_MACHINE.get(domain)
+
+
+_TIMING_DOMAINS_BY_NAME: t.Final = TimingBarDomain.__members__
 
 
 def user_to_timing_domain(user: str) -> t.Optional[TimingBarDomain]:
@@ -253,16 +303,48 @@ def user_to_timing_domain(user: str) -> t.Optional[TimingBarDomain]:
     """
     if not user:
         return None
-    try:
-        domain, user, _cycle = user.split(".")
-    except ValueError:
-        raise ValueError(f"expected format <domain>.USER.<cycle>: {user!r}") from None
-    if user.upper() != "USER":
+    # Locate both dots instead of splitting, so that we don't allocate
+    # a list and three strings on every call.
+    first = user.find(".")
+    second = user.find(".", first + 1) if first >= 0 else -1
+    if second < 0 or user.find(".", second + 1) >= 0:
+        raise ValueError(f"expected format <domain>.USER.<cycle>: {user!r}")
+    if user[first + 1 : second].upper() != "USER":
         raise ValueError(f"middle of timing selector must be 'USER': {user!r}")
-    try:
-        return TimingBarDomain[domain]
-    except KeyError:
-        raise ValueError(f"unknown timing domain: {user!r}") from None
+    domain = _TIMING_DOMAINS_BY_NAME.get(user[:first])
+    if domain is None:
+        raise ValueError(f"unknown timing domain: {user!r}")
+    return domain
+
+
+@functools.cache
+def _get_machine_to_activity() -> t.Mapping[
+    coi.Machine, t.Union[None, str, NamedActivity]
+]:
+    """Build the table for `machine_to_activity()` on first use.
+
+    This defers importing :mod:`pylogbook` until the table is needed.
+    """
+    # pylint: disable = import-outside-toplevel
+    from pylogbook import NamedActivity
+
+    return MappingProxyType(
+        {
+            coi.Machine.NO_MACHINE: None,
+            coi.Machine.LINAC_2: NamedActivity.LINAC4,
+            coi.Machine.LINAC_3: NamedActivity.LINAC3,
+            coi.Machine.LINAC_4: NamedActivity.LINAC4,
+            coi.Machine.LEIR: NamedActivity.LEIR,
+            coi.Machine.PS: NamedActivity.PS,
+            coi.Machine.PSB: NamedActivity.PSB,
+            coi.Machine.SPS: NamedActivity.SPS,
+            coi.Machine.AWAKE: None,
+            coi.Machine.LHC: NamedActivity.LHC,
+            coi.Machine.ISOLDE: None,
+            coi.Machine.AD: "ADE",
+            coi.Machine.ELENA: NamedActivity.ELENA,
+        }
+    )
 
 
 def machine_to_activity(machine: coi.Machine) -> t.Union[None, str, NamedActivity]:
@@ -271,33 +353,11 @@ def machine_to_activity(machine: coi.Machine) -> t.Union[None, str, NamedActivit
     Note that the mapping is not complete: Not every activity is
     returned and not every machine has an associated activity.
     """
-    return {
-        coi.Machine.NO_MACHINE: None,
-        coi.Machine.LINAC_2: NamedActivity.LINAC4,
-        coi.Machine.LINAC_3: NamedActivity.LINAC3,
-        coi.Machine.LINAC_4: NamedActivity.LINAC4,
-        coi.Machine.LEIR: NamedActivity.LEIR,
-        coi.Machine.PS: NamedActivity.PS,
-        coi.Machine.PSB: NamedActivity.PSB,
-        coi.Machine.SPS: NamedActivity.SPS,
-        coi.Machine.AWAKE: None,
-        coi.Machine.LHC: NamedActivity.LHC,
-        coi.Machine.ISOLDE: None,
-        coi.Machine.AD: "ADE",
-        coi.Machine.ELENA: NamedActivity.ELENA,
-    }.get(machine)
+    return _get_machine_to_activity().get(machine)
 
 
-def machine_to_lsa_accelerator(
-    machine: coi.Machine,
-) -> t.Optional[LsaSelectorAccelerator]:
-    """Return the LSA accelerator for a given CERN machine.
-
-    Note that the mapping is surjective: some machines map to the same
-    domain. The only way for this function to return `None` is by
-    passing `~cernml.coi.Machine.NO_MACHINE`.
-    """
-    return {
+_MACHINE_TO_LSA_ACCELERATOR: t.Final = MappingProxyType(
+    {
         coi.Machine.LINAC_2: LsaSelectorAccelerator.PSB,
         coi.Machine.LINAC_3: LsaSelectorAccelerator.LEIR,
         coi.Machine.LINAC_4: LsaSelectorAccelerator.PSB,
@@ -310,7 +370,20 @@ def machine_to_lsa_accelerator(
         coi.Machine.ISOLDE: LsaSelectorAccelerator.ISOLDE,
         coi.Machine.AD: LsaSelectorAccelerator.AD,
         coi.Machine.ELENA: LsaSelectorAccelerator.ELENA,
-    }.get(machine)
+    }
+)
+
+
+def machine_to_lsa_accelerator(
+    machine: coi.Machine,
+) -> t.Optional[LsaSelectorAccelerator]:
+    """Return the LSA accelerator for a given CERN machine.
+
+    Note that the mapping is surjective: some machines map to the same
+    domain. The only way for this function to return `None` is by
+    passing `~cernml.coi.Machine.NO_MACHINE`.
+    """
+    return _MACHINE_TO_LSA_ACCELERATOR.get(machine)
 
 
 def lsa_accelerator_to_server(accelerator: LsaSelectorAccelerator) -> str:
@@ -321,14 +394,8 @@ def lsa_accelerator_to_server(accelerator: LsaSelectorAccelerator) -> str:
     return accelerator.name.lower()
 
 
-def lsa_server_to_accelerator(server: str) -> t.Optional[LsaSelectorAccelerator]:
-    """Return the accelerator most closely linked to the given LSA server.
-
-    Note that the mapping neither injective nor surjective: some
-    accelerators are associated with more than one LSA server and some
-    servers are not associated with any accelerator at all.
-    """
-    return {
+_LSA_SERVER_TO_ACCELERATOR: t.Final = MappingProxyType(
+    {
         "next_inca_ps": LsaSelectorAccelerator.PS,
         "ad": LsaSelectorAccelerator.AD,
         "ps": LsaSelectorAccelerator.PS,
@@ -344,22 +411,22 @@ def lsa_server_to_accelerator(server: str) -> t.Optional[LsaSelectorAccelerator]
         "psb": LsaSelectorAccelerator.PSB,
         "ctf": LsaSelectorAccelerator.CTF,
         "north": LsaSelectorAccelerator.NORTH,
-    }.get(server.lower())
+    }
+)
 
 
-def lsa_server_to_machine(server: str) -> t.Optional[coi.Machine]:
-    """Return the machine most closely linked to the giving timing domain.
+def lsa_server_to_accelerator(server: str) -> t.Optional[LsaSelectorAccelerator]:
+    """Return the accelerator most closely linked to the given LSA server.
 
-    Note that the mapping is very arbitrary: not every machine is
-    returned, some machines are returned for multiple servers, and some
-    servers don't have an associated machine.
+    Note that the mapping neither injective nor surjective: some
+    accelerators are associated with more than one LSA server and some
+    servers are not associated with any accelerator at all.
     """
-    # Special-case: We already know that CTF (CLiC Test Facility) is an
-    # LSA server that the COI don't support yet.
-    server = server.lower()
-    if server == "ctf":
-        raise KeyError(server)
-    return {
+    return _LSA_SERVER_TO_ACCELERATOR.get(server.lower())
+
+
+_LSA_SERVER_TO_MACHINE: t.Final = MappingProxyType(
+    {
         "next_inca_ps": coi.Machine.PS,
         "ad": coi.Machine.AD,
         "ps": coi.Machine.PS,
@@ -373,4 +440,23 @@ def lsa_server_to_machine(server: str) -> t.Optional[coi.Machine]:
         "isolde": coi.Machine.ISOLDE,
         "testbed_lhc": coi.Machine.LHC,
         "psb": coi.Machine.PSB,
-    }.get(server.lower())
+    }
+)
+
+
+# Special-case: We already know that CTF (CLiC Test Facility) is an LSA
+# server that the COI don't support yet.
+_UNSUPPORTED_LSA_SERVERS: t.Final = frozenset(["ctf"])
+
+
+def lsa_server_to_machine(server: str) -> t.Optional[coi.Machine]:
+    """Return the machine most closely linked to the giving timing domain.
+
+    Note that the mapping is very arbitrary: not every machine is
+    returned, some machines are returned for multiple servers, and some
+    servers don't have an associated machine.
+    """
+    server = server.lower()
+    if server in _UNSUPPORTED_LSA_SERVERS:
+        raise KeyError(server)
+    return _LSA_SERVER_TO_MACHINE.get(server)
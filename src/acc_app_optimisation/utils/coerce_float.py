@@ -13,7 +13,7 @@ Floating = t.TypeVar("Floating", bound=t.SupportsFloat)
 
 def coerce_float_tuple(collection: t.Collection[Floating]) -> t.Tuple[float, ...]:
     """Coerce a collection of floating-point values to a tuple of floats."""
-    return tuple(coerce_float(num) for num in collection)
+    return tuple(map(coerce_float, collection))
 
 
 def coerce_float(number: t.SupportsFloat) -> float:
@@ -44,6 +44,8 @@ def coerce_float(number: t.SupportsFloat) -> float:
     # `__float__()` method. We don't want to accept strings, so we use
     # the latter.
     type_ = type(number)
+    if type_ is float:
+        return t.cast(float, number)
     try:
         return type_.__float__(number)  # pylint: disable=unnecessary-dunder-call
     except TypeError:
@@ -6,6 +6,7 @@
 
 """Provide `split_words_and_spaces()`."""
 
+import re
 import typing as t
 
 
@@ -21,6 +22,9 @@ class Token(t.NamedTuple):
         return self.text.isspace()
 
 
+_WORDS_AND_SPACES = re.compile(r"\s+|\S+")
+
+
 def split_words_and_spaces(text: str) -> t.Iterator[Token]:
     """Return an iterator over words and spaces in the given text.
 
@@ -38,16 +42,7 @@ def split_words_and_spaces(text: str) -> t.Iterator[Token]:
         Token(text='D', begin=9, end=10)
         Token(text=' ', begin=10, end=11)
     """
-    # Split string into parts that may contain leading, but no trailing
-    # whitespace. Yield first the whitespace, then the word.
-    span_begin = span_end = 0
-    for word in text.split():
-        span_begin = span_end
-        word_begin = text.find(word, span_end)
-        span_end = word_begin + len(word)
-        if span_begin != word_begin:
-            yield Token(text[span_begin:word_begin], span_begin, word_begin)
-        yield Token(word, word_begin, span_end)
-    # Handle trailing whitespace.
-    if span_end != len(text):
-        yield Token(text[span_end:], span_end, len(text))
+    # `\s` matches exactly the characters for which `str.isspace()` is
+    # true, so this splits at the same places as `str.split()`.
+    for match in _WORDS_AND_SPACES.finditer(text):
+        yield Token(match.group(), match.start(), match.end())